@@ -1,13 +1,49 @@
 import os
+import sys
+import hashlib
+import pickle
 import yaml
 import re
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any
-from dataclasses import dataclass
-from PyPDF2 import PdfReader
+from typing import List, Dict, Any, Optional
 from langchain_core.documents import Document
 
+# PyMuPDF extracts text roughly 10x faster than PyPDF2; keep PyPDF2 as fallback
+# (imported as pymupdf - the legacy fitz name prints a deprecation notice in recent releases)
+try:
+    import pymupdf as fitz
+except ImportError:
+    try:
+        import fitz
+    except ImportError:
+        fitz = None
+        from PyPDF2 import PdfReader
+
+# Extractor name and version - the two backends produce different page text
+if fitz is not None:
+    PDF_BACKEND = f"pymupdf-{fitz.VersionBind}"
+else:
+    import PyPDF2
+    PDF_BACKEND = f"PyPDF2-{PyPDF2.__version__}"
+
+# libyaml's C loader parses manifests much faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as ManifestLoader
+except ImportError:
+    from yaml import SafeLoader as ManifestLoader
+
+# Aho-Corasick automaton finds all keywords in one pass; plain scan otherwise
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Setup logging directory and configure logging
 LOG_DIR = Path("backend/logs")
 LOG_DIR.mkdir(exist_ok=True, parents=True)
@@ -23,32 +59,72 @@ logging.basicConfig(
 )
 logger = logging.getLogger("NutriGuide-DocumentProcessor")
 logger.info("Document processor initialized - safety-critical system starting")
+logger.info(f"YAML C extension: {'available' if ManifestLoader.__name__ == 'CSafeLoader' else 'MISSING - install libyaml'}")
 
-# Metadata structure for nutrition documents
-@dataclass
-class DocumentMetadata:
-    """Tracks critical document properties for safety and compliance"""
-    source_id: str
-    source_file: str
-    page_number: int
-    document_type: str
-    topics: List[str]
-    life_stages: List[str]
-    contains_tables: bool
-    safety_level: str
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert metadata to dictionary format for LangChain"""
-        return {
-            "source": self.source_id,
-            "source_file": self.source_file,
-            "page": self.page_number,
-            "document_type": self.document_type,
-            "topics": self.topics,
-            "life_stages": self.life_stages,
-            "contains_tables": self.contains_tables,
-            "safety_level": self.safety_level
-        }
+# Log queue of the current worker process (None in the main process)
+_log_queue = None
+
+def _init_worker_logging(queue) -> None:
+    """Send a worker's log records to the main process instead of the log file"""
+    global _log_queue
+    _log_queue = queue
+    
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(QueueHandler(queue))
+
+@contextmanager
+def queued_logging():
+    """Yield a queue for worker logging, drained by one listener thread in the main process"""
+    # Nested pools reuse the queue their worker was given
+    if _log_queue is not None:
+        yield _log_queue
+        return
+    
+    queue = multiprocessing.Queue()
+    listener = QueueListener(queue, *logging.getLogger().handlers, respect_handler_level=True)
+    listener.start()
+    try:
+        yield queue
+    finally:
+        listener.stop()
+
+# Single-pass multi-keyword matching
+class KeywordScanner:
+    """Counts distinct keyword hits per category with one pass over the text"""
+    
+    def __init__(self, categories: Dict[str, List[str]]):
+        # Map each keyword to every category it belongs to
+        self.keywords: Dict[str, tuple] = {}
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                self.keywords[keyword] = self.keywords.get(keyword, ()) + (category,)
+        
+        self.automaton = None
+        if ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for keyword, keyword_categories in self.keywords.items():
+                self.automaton.add_word(keyword, (keyword, keyword_categories))
+            self.automaton.make_automaton()
+    
+    def scan(self, text_lower: str) -> Counter:
+        """Return how many distinct keywords of each category occur in the text"""
+        counts = Counter()
+        
+        if self.automaton is not None:
+            seen = set()
+            for _, (keyword, keyword_categories) in self.automaton.iter(text_lower):
+                if keyword not in seen:
+                    seen.add(keyword)
+                    counts.update(keyword_categories)
+        else:
+            for keyword, keyword_categories in self.keywords.items():
+                if keyword in text_lower:
+                    counts.update(keyword_categories)
+        
+        return counts
 
 # Core content filtering logic
 class ContentFilter:
@@ -72,25 +148,46 @@ class ContentFilter:
         "government printing office", "library of congress", "executive summary", "key recommendations", "page x", "page xi", "page xii"
     ]
     
+    # Terms identifying each life stage group
+    LIFE_STAGE_TERMS = {
+        "pregnant": ["pregnant", "pregnancy", "maternal", "antenatal"],
+        "breastfeeding": ["breastfeed", "lactation", "breast milk"],
+        "infants": ["infant", "baby", "birth", "newborn", "0-12 months"],
+        "children_teens": ["child", "children", "adolescent", "teen", "toddler", "preschool"],
+        "adult": ["adult", "adults", "middle aged"],
+        "older": ["older", "elderly", "senior", "65+", "aging"],
+        "athletes": ["athlete", "sports"]
+    }
+    
+    # Terms that raise the safety level of a nutrition page
+    MEDICAL_TRIGGERS = ["pregnant", "breastfeed", "infant", "medical condition", "disease", "disorder", "illness"]
+    PROFESSIONAL_TRIGGERS = ["professional use only", "healthcare provider", "clinician", "prescribe", "diagnose", "treat"]
+    
+    # Front-matter page limits: (admin pages, low-nutrition pages). WHO nutrient
+    # guidelines carry acknowledgments/ISBN front matter too, so every type uses these
+    ADMIN_PAGE_LIMIT = 15
+    NUTRITION_PAGE_LIMIT = 20
+    
     @staticmethod
-    def is_low_value_page(text: str, page_num: int, total_pages: int, nutrition_matches: int) -> bool:
+    def is_low_value_page(text: str, text_lower: str, page_num: int, matches: Counter) -> bool:
         """Skip pages with administrative content or insufficient nutrition information"""
         if not text or len(text.strip()) == 0:
             logger.debug(f"Skipping empty page {page_num}")
             return True
-            
-        text_lower = text.lower().strip()
-        word_count = len(text_lower.split())
         
-        # USDA documents put admin stuff in first 15 pages
-        if page_num <= 15:
-            admin_matches = sum(1 for pattern in ContentFilter.USDA_ADMIN_PATTERNS if pattern in text_lower)
+        # Approximate word count from separators - avoids building a token list
+        word_count = text_lower.count(' ') + text_lower.count('\n') + 1
+        
+        # Official documents put admin stuff in their first pages
+        if page_num <= ContentFilter.ADMIN_PAGE_LIMIT:
+            admin_matches = matches["admin"]
             if admin_matches >= 1:
                 logger.info(f"Skipping page {page_num}: administrative content ({admin_matches} matches)")
                 return True
         
-        # First 20 pages need decent nutrition content
-        if page_num <= 20 and nutrition_matches < 3:
+        # Early pages need decent nutrition content
+        nutrition_matches = matches["nutrition"]
+        if page_num <= ContentFilter.NUTRITION_PAGE_LIMIT and nutrition_matches < 3:
             logger.info(f"Skipping page {page_num}: insufficient nutrition content ({nutrition_matches} keywords)")
             return True
         
@@ -107,32 +204,33 @@ class ContentFilter:
         return False
     
     @staticmethod
-    def detect_life_stages(text: str) -> List[str]:
+    def detect_life_stages(text_lower: str, matches: Optional[Counter] = None) -> List[str]:
         """Identify life stages mentioned for targeted recommendations"""
         life_stages = set()
-        text_lower = text.lower()
+        if matches is None:
+            matches = PAGE_SCANNER.scan(text_lower)
         
         # Pregnancy/lactation terms
-        if any(term in text_lower for term in ["pregnant", "pregnancy", "maternal", "antenatal"]):
+        if matches["pregnant"]:
             life_stages.add("pregnant")
-        if any(term in text_lower for term in ["breastfeed", "lactation", "breast milk"]):
+        if matches["breastfeeding"]:
             life_stages.add("breastfeeding")
         
         # Infant/child terms
-        if any(term in text_lower for term in ["infant", "baby", "birth", "newborn", "0-12 months"]):
+        if matches["infants"]:
             life_stages.add("infants")
-        if any(term in text_lower for term in ["child", "children", "adolescent", "teen", "toddler", "preschool"]):
+        if matches["children_teens"]:
             life_stages.add("children_teens")
         
         # Adult terms
-        if any(term in text_lower for term in ["adult", "adults", "middle aged"]):
-            if any(term in text_lower for term in ["older", "elderly", "senior", "65+", "aging"]):
+        if matches["adult"]:
+            if matches["older"]:
                 life_stages.add("older_adults")
             else:
                 life_stages.add("adults")
         
         # Special cases
-        if "athlete" in text_lower or "sports" in text_lower:
+        if matches["athletes"]:
             life_stages.add("athletes")
         
         return list(life_stages) if life_stages else ["general"]
@@ -141,63 +239,84 @@ class ContentFilter:
 class TableProcessor:
     """Detects and marks actual nutrient recommendation tables"""
     
+    # Real nutrient table indicators
+    NUTRIENT_INDICATORS = [
+        "daily value", "dv%", "recommended intake", "adequate intake",
+        "tolerable upper intake level", "ul", "ai", "rda", 
+        "food sources of", "milligrams per day", "grams per day",
+        "sodium recommendation", "sugar recommendation", "fat recommendation",
+        "vitamin d", "calcium", "potassium", "fiber", "nutrient"
+    ]
+    
+    # Disqualifiers (admin tables)
+    NON_NUTRIENT_INDICATORS = [
+        "table of contents", "figure", "appendix", "bibliography",
+        "references", "acknowledgments", "contributors", "reviewers",
+        "chapter", "section", "part", "page number"
+    ]
+    
     @staticmethod
-    def detect_nutrient_tables(text: str) -> bool:
+    def detect_nutrient_tables(text_lower: str, matches: Optional[Counter] = None) -> bool:
         """Only flag real nutrient tables, ignore admin tables"""
-        text_lower = text.lower()
-        
-        # Real nutrient table indicators
-        nutrient_indicators = [
-            "daily value", "dv%", "recommended intake", "adequate intake",
-            "tolerable upper intake level", "ul", "ai", "rda", 
-            "food sources of", "milligrams per day", "grams per day",
-            "sodium recommendation", "sugar recommendation", "fat recommendation",
-            "vitamin d", "calcium", "potassium", "fiber", "nutrient"
-        ]
-        
-        # Disqualifiers (admin tables)
-        non_nutrient_indicators = [
-            "table of contents", "figure", "appendix", "bibliography",
-            "references", "acknowledgments", "contributors", "reviewers",
-            "chapter", "section", "part", "page number"
-        ]
-        
-        nutrient_count = sum(1 for indicator in nutrient_indicators if indicator in text_lower)
-        has_disqualifier = any(indicator in text_lower for indicator in non_nutrient_indicators)
+        if matches is None:
+            matches = PAGE_SCANNER.scan(text_lower)
+        
+        nutrient_count = matches["nutrient_table"]
+        has_disqualifier = matches["admin_disqualifier"] > 0
         
         # Need at least 2 nutrient indicators and no disqualifiers
         return nutrient_count >= 2 and not has_disqualifier
     
     @staticmethod
-    def extract_table_content(text: str) -> str:
+    def extract_table_content(text: str, text_lower: str, matches: Optional[Counter] = None) -> str:
         """Wrap real nutrient tables with markers for special handling"""
-        if not TableProcessor.detect_nutrient_tables(text):
+        if not TableProcessor.detect_nutrient_tables(text_lower, matches):
             return text
         
         return f"[NUTRIENT_TABLE_START]\n{text}\n[NUTRIENT_TABLE_END]"
 
+# Admin keywords that should never survive into final chunks
+VALIDATION_ADMIN_KEYWORDS = [
+    "citation", "downloaded", "publication", "printed", "isbn",
+    "government printing", "congress", "copyright", "reserved",
+    "acknowledgments", "funding", "contract", "prepared by",
+    "submitted to", "drafted by", "suggested citation", "dietaryguidelines.gov"
+]
+
+# Keyword scanners are compiled once at import and shared by every page
+PAGE_SCANNER = KeywordScanner({
+    "nutrition": ContentFilter.NUTRITION_KEYWORDS,
+    "admin": ContentFilter.USDA_ADMIN_PATTERNS,
+    **ContentFilter.LIFE_STAGE_TERMS,
+    "nutrient_table": TableProcessor.NUTRIENT_INDICATORS,
+    "admin_disqualifier": TableProcessor.NON_NUTRIENT_INDICATORS,
+    "medical_trigger": ContentFilter.MEDICAL_TRIGGERS,
+    "professional_trigger": ContentFilter.PROFESSIONAL_TRIGGERS
+})
+VALIDATION_SCANNER = KeywordScanner({
+    "admin": VALIDATION_ADMIN_KEYWORDS,
+    "nutrition": ContentFilter.NUTRITION_KEYWORDS,
+    "citation_sentinel": ["suggested citation"],
+    "website_sentinel": ["dietaryguidelines.gov"]
+})
+
 # Quality validation for processed chunks
 def validate_processed_chunks(documents: List[Document]) -> List[tuple]:
     """Catches chunks with admin content that slipped through filtering"""
-    admin_keywords = [
-        "citation", "downloaded", "publication", "printed", "isbn",
-        "government printing", "congress", "copyright", "reserved",
-        "acknowledgments", "funding", "contract", "prepared by",
-        "submitted to", "drafted by", "suggested citation", "dietaryguidelines.gov"
-    ]
-    
     problematic_chunks = []
     
     for i, doc in enumerate(documents):
         text_lower = doc.page_content.lower()
-        admin_count = sum(1 for kw in admin_keywords if kw in text_lower)
-        nutrition_count = sum(1 for kw in ContentFilter.NUTRITION_KEYWORDS if kw in text_lower)
-        word_count = len(text_lower.split())
+        matches = VALIDATION_SCANNER.scan(text_lower)
+        admin_count = matches["admin"]
+        nutrition_count = matches["nutrition"]
+        # Approximate word count from separators - avoids building a token list
+        word_count = text_lower.count(' ') + text_lower.count('\n') + 1
         
         # Flag admin-heavy chunks with insufficient nutrition content
         if (admin_count >= 2 and nutrition_count < 2 and word_count < 300) or \
-           ("suggested citation" in text_lower) or \
-           ("dietaryguidelines.gov" in text_lower and nutrition_count < 3):
+           matches["citation_sentinel"] or \
+           (matches["website_sentinel"] and nutrition_count < 3):
             problematic_chunks.append((
                 i,
                 doc.metadata['source'],
@@ -210,8 +329,143 @@ def validate_processed_chunks(documents: List[Document]) -> List[tuple]:
     
     return problematic_chunks
 
+# Document ID keywords that determine document type
+NUTRIENT_TOKENS = frozenset({"nutrient", "sodium", "sugar", "fat", "vitamin"})
+SUMMARY_TOKENS = frozenset({"summary", "executive"})
+
+def detect_document_type(doc_id: str) -> str:
+    """Classify a manifest entry by keywords in its ID"""
+    id_lower = doc_id.lower()
+    
+    # Substring match so plural IDs like 'who_sugars_intake_2015' still count
+    if any(token in id_lower for token in NUTRIENT_TOKENS):
+        return "nutrient_specific"
+    if any(token in id_lower for token in SUMMARY_TOKENS):
+        return "summary"
+    return "core_guideline"
+
+# PDF access shared by the serial and parallel page loops
+def open_pdf(file_path: Path) -> tuple:
+    """Open a PDF and return (reader, pages, total_pages)"""
+    if fitz is not None:
+        reader = fitz.open(str(file_path))
+        return reader, reader, reader.page_count
+    
+    # Lenient parsing tolerates malformed xref sections instead of raising;
+    # a path (not a file object) lets PyPDF2 load the file into memory in one read
+    reader = PdfReader(str(file_path), strict=False)
+    return reader, reader.pages, len(reader.pages)
+
+def extract_page_text(page) -> str:
+    """Extract raw text from a PyMuPDF or PyPDF2 page"""
+    if fitz is not None:
+        return page.get_text("text") or ""
+    return page.extract_text() or ""
+
+# Pages whose content stream is smaller than this hold no meaningful text
+MIN_CONTENT_STREAM_BYTES = 200
+
+def is_blank_page(page) -> bool:
+    """Detect blank or figure-only pages from the raw content stream, before text extraction"""
+    if fitz is None:
+        return False
+    
+    # Text drawn inside form XObjects does not appear in the page's own stream
+    return len(page.read_contents()) < MIN_CONTENT_STREAM_BYTES and not page.get_xobjects()
+
+def classify_page(text: str, page_num: int, context: Dict[str, Any]) -> Optional[Document]:
+    """Filter and annotate one page, returning None for low-value pages"""
+    text_lower = text.lower()
+    
+    # One scan feeds every filter below, including nutrition content density
+    matches = PAGE_SCANNER.scan(text_lower)
+    nutrition_matches = matches["nutrition"]
+    
+    # Skip low-value pages
+    if ContentFilter.is_low_value_page(text, text_lower, page_num, matches):
+        return None
+    
+    # Only detect life stages on meaningful nutrition pages
+    if nutrition_matches >= 3:
+        life_stages = ContentFilter.detect_life_stages(text_lower, matches)
+    else:
+        life_stages = ["general"]
+    
+    # Detect and mark nutrient tables
+    contains_tables = TableProcessor.detect_nutrient_tables(text_lower, matches)
+    if contains_tables:
+        text = TableProcessor.extract_table_content(text, text_lower, matches)
+    
+    # Determine safety level
+    if nutrition_matches < 3:
+        safety_level = "administrative"
+    else:
+        safety_level = "general"
+        if matches["medical_trigger"]:
+            safety_level = "medical_caution"
+        
+        if matches["professional_trigger"]:
+            safety_level = "professional_use_only"
+    
+    # Metadata tracks critical document properties for safety and compliance
+    return Document(
+        page_content=text,
+        metadata={
+            "source": context['source_id'],
+            "source_file": context['source_file'],
+            "page": page_num,
+            "document_type": context['doc_type'],
+            "topics": context['topics'],
+            "life_stages": life_stages,
+            "contains_tables": contains_tables,
+            "safety_level": safety_level
+        }
+    )
+
+def extract_and_classify(page, page_num: int, context: Dict[str, Any]) -> tuple:
+    """Process one page into (page_num, document or None, extracted_ok)"""
+    try:
+        if is_blank_page(page):
+            logger.debug(f"Skipping empty page {page_num}")
+            return page_num, None, True
+        
+        text = extract_page_text(page)
+        return page_num, classify_page(text, page_num, context), True
+    except Exception as e:
+        logger.warning(f"   Error on page {page_num} of {context['source_id']}: {str(e)}")
+        return page_num, None, False
+
+# Page pool worker state - each worker opens its own copy of the PDF
+_worker_pages = None
+_worker_context = None
+
+def _init_page_worker(file_path: str, context: Dict[str, Any], log_queue) -> None:
+    """Open the PDF once per page worker process"""
+    global _worker_pages, _worker_context
+    _init_worker_logging(log_queue)
+    _, _worker_pages, _ = open_pdf(Path(file_path))
+    _worker_context = context
+
+def _extract_and_classify_page(page_index: int) -> tuple:
+    """Page pool task - PDF handles can't be pickled, so workers index their own copy"""
+    return extract_and_classify(_worker_pages[page_index], page_index + 1, _worker_context)
+
+# Enum-like metadata fields with only a handful of distinct values across the corpus
+INTERNED_METADATA_FIELDS = ("source", "source_file", "document_type", "safety_level")
+
+def intern_metadata(documents: List[Document]) -> None:
+    """Share one string object per metadata value across chunks from different processes"""
+    for doc in documents:
+        metadata = doc.metadata
+        for field in INTERNED_METADATA_FIELDS:
+            metadata[field] = sys.intern(metadata[field])
+        metadata['life_stages'] = [sys.intern(stage) for stage in metadata['life_stages']]
+
+# Below this size a page pool costs more to start than it saves
+PARALLEL_PAGE_THRESHOLD = 50
+
 # Processes a single document
-def process_single_document(entry: Dict[str, Any]) -> List[Document]:
+def process_single_document(entry: Dict[str, Any], page_workers: Optional[int] = None) -> List[Document]:
     """Process one PDF document into clean, metadata-rich chunks"""
     file_path = Path(entry['path'])
     
@@ -221,87 +475,55 @@ def process_single_document(entry: Dict[str, Any]) -> List[Document]:
     logger.debug(f"Opening PDF: {file_path}")
     
     try:
-        reader = PdfReader(str(file_path))
+        reader, pages, total_pages = open_pdf(file_path)
     except Exception as e:
         raise ValueError(f"PDF read error {file_path}: {str(e)}") from e
     
-    total_pages = len(reader.pages)
     logger.info(f"   Document has {total_pages} pages")
     
-    # Determine document type
-    doc_type = "core_guideline"
-    if any(keyword in entry['id'].lower() for keyword in ["nutrient", "sodium", "sugar", "fat", "vitamin"]):
-        doc_type = "nutrient_specific"
-    elif "summary" in entry['id'].lower() or "executive" in entry['id'].lower():
-        doc_type = "summary"
+    # Per-document metadata shared by every page
+    context = {
+        "source_id": entry['id'],
+        "source_file": os.path.basename(file_path),
+        "doc_type": detect_document_type(entry['id']),
+        "topics": entry.get('topics', ['general'])
+    }
+    
+    if page_workers is None:
+        page_workers = os.cpu_count() or 1
+    
+    # Process each page - large PDFs are split across a process pool
+    try:
+        if page_workers > 1 and total_pages > PARALLEL_PAGE_THRESHOLD:
+            logger.info(f"   Extracting pages with {page_workers} worker processes")
+            with queued_logging() as log_queue, multiprocessing.Pool(
+                processes=page_workers,
+                initializer=_init_page_worker,
+                initargs=(str(file_path), context, log_queue)
+            ) as pool:
+                results = sorted(
+                    pool.imap_unordered(_extract_and_classify_page, range(total_pages), chunksize=8),
+                    key=lambda result: result[0]
+                )
+        else:
+            results = [
+                extract_and_classify(page, page_num, context)
+                for page_num, page in enumerate(pages, start=1)
+            ]
+    finally:
+        if fitz is not None:
+            reader.close()
     
     processed_docs = []
     valid_pages = 0
     skipped_pages = 0
     
-    # Process each page
-    for page_num in range(1, total_pages + 1):
-        try:
-            page = reader.pages[page_num - 1]
-            text = page.extract_text() or ""
-            text_lower = text.lower()
-            
-            # Calculate nutrition content density
-            nutrition_matches = sum(1 for keyword in ContentFilter.NUTRITION_KEYWORDS if keyword in text_lower)
-            
-            # Skip low-value pages
-            if ContentFilter.is_low_value_page(text, page_num, total_pages, nutrition_matches):
-                skipped_pages += 1
-                continue
-            
+    for page_num, doc, extracted in results:
+        if doc is not None:
             valid_pages += 1
-            
-            # Only detect life stages on meaningful nutrition pages
-            if nutrition_matches >= 3:
-                life_stages = ContentFilter.detect_life_stages(text)
-            else:
-                life_stages = ["general"]
-            
-            # Detect and mark nutrient tables
-            contains_tables = TableProcessor.detect_nutrient_tables(text)
-            if contains_tables:
-                text = TableProcessor.extract_table_content(text)
-            
-            # Determine safety level
-            if nutrition_matches < 3:
-                safety_level = "administrative"
-            else:
-                safety_level = "general"
-                medical_triggers = ["pregnant", "breastfeed", "infant", "medical condition", "disease", "disorder", "illness"]
-                if any(trigger in text_lower for trigger in medical_triggers):
-                    safety_level = "medical_caution"
-                
-                professional_triggers = ["professional use only", "healthcare provider", "clinician", "prescribe", "diagnose", "treat"]
-                if any(trigger in text_lower for trigger in professional_triggers):
-                    safety_level = "professional_use_only"
-            
-            # Create metadata and document
-            metadata = DocumentMetadata(
-                source_id=entry['id'],
-                source_file=os.path.basename(file_path),
-                page_number=page_num,
-                document_type=doc_type,
-                topics=entry.get('topics', ['general']),
-                life_stages=life_stages,
-                contains_tables=contains_tables,
-                safety_level=safety_level
-            )
-            
-            doc = Document(
-                page_content=text,
-                metadata=metadata.to_dict()
-            )
-            
             processed_docs.append(doc)
-            
-        except Exception as e:
-            logger.warning(f"   Error on page {page_num} of {entry['id']}: {str(e)}")
-            continue
+        elif extracted:
+            skipped_pages += 1
     
     logger.info(f"   Valid pages: {valid_pages}, Skipped: {skipped_pages}")
     logger.info(f"   Created {len(processed_docs)} chunks from {entry['id']}")
@@ -311,8 +533,61 @@ def process_single_document(entry: Dict[str, Any]) -> List[Document]:
     
     return processed_docs
 
+# Processed-corpus cache keyed on manifest, PDF and processor file stats
+def corpus_cache_key(manifest_file: Path, corpus: List[Dict[str, Any]]) -> str:
+    """Fingerprint the manifest, every PDF it lists, the PDF extractor and this processor's code"""
+    key = hashlib.blake2b(digest_size=16)
+    key.update(f"{PDF_BACKEND}\n".encode('utf-8'))
+    
+    paths = [manifest_file, Path(__file__)] + [Path(entry['path']) for entry in corpus]
+    for path in paths:
+        try:
+            stat = path.stat()
+            key.update(f"{path}|{stat.st_mtime_ns}|{stat.st_size}\n".encode('utf-8'))
+        except OSError:
+            key.update(f"{path}|missing\n".encode('utf-8'))
+    
+    return key.hexdigest()
+
+def corpus_cache_file(manifest_file: Path, corpus: List[Dict[str, Any]]) -> Path:
+    """Cache path for this manifest - prefixed per manifest so different corpora keep their own cache"""
+    manifest_tag = hashlib.blake2b(str(manifest_file.resolve()).encode('utf-8'), digest_size=8).hexdigest()
+    return LOG_DIR / f".doccache_{manifest_tag}_{corpus_cache_key(manifest_file, corpus)}.pkl"
+
+def load_cached_documents(cache_file: Path) -> Optional[List[Document]]:
+    """Return cached chunks from a previous identical run, if any"""
+    if not cache_file.exists():
+        return None
+    
+    try:
+        with open(cache_file, 'rb') as f:
+            documents = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable document cache {cache_file}: {str(e)}")
+        return None
+    
+    logger.info(f"Loaded {len(documents)} validated chunks from cache: {cache_file}")
+    return documents
+
+def save_cached_documents(cache_file: Path, documents: List[Document]) -> None:
+    """Persist validated chunks and drop caches from older versions of the same manifest's corpus"""
+    manifest_prefix = cache_file.name.rsplit('_', 1)[0]
+    try:
+        for stale in LOG_DIR.glob(f"{manifest_prefix}_*.pkl"):
+            if stale != cache_file:
+                stale.unlink()
+        
+        # Write to a temp file first so an interrupted run never leaves a truncated cache
+        tmp_file = cache_file.with_suffix(".tmp")
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(documents, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+        logger.info(f"Saved {len(documents)} validated chunks to cache: {cache_file}")
+    except Exception as e:
+        logger.warning(f"Could not write document cache {cache_file}: {str(e)}")
+
 # Main entry point
-def load_and_preprocess_documents(manifest_path: str = "manifests/corpus_manifest.yaml") -> List[Document]:
+def load_and_preprocess_documents(manifest_path: str = "manifests/corpus_manifest.yaml", use_cache: bool = True) -> List[Document]:
     """Load and process all documents from manifest file"""
     logger.info(f"Starting document processing from manifest: {manifest_path}")
     
@@ -325,7 +600,7 @@ def load_and_preprocess_documents(manifest_path: str = "manifests/corpus_manifes
     
     try:
         with open(manifest_file, 'r', encoding='utf-8') as f:
-            corpus = yaml.safe_load(f)
+            corpus = yaml.load(f, Loader=ManifestLoader)
         logger.info(f"Loaded manifest with {len(corpus)} documents")
     except Exception as e:
         error_msg = f"Manifest load error: {str(e)}"
@@ -333,30 +608,68 @@ def load_and_preprocess_documents(manifest_path: str = "manifests/corpus_manifes
         logger.error("Check YAML syntax - look for indentation errors")
         raise ValueError(error_msg) from e
     
+    # Reuse the last run's chunks when neither the manifest nor any PDF changed
+    cache_file = None
+    if use_cache:
+        cache_file = corpus_cache_file(manifest_file, corpus)
+        cached_documents = load_cached_documents(cache_file)
+        if cached_documents is not None:
+            return cached_documents
+    
     all_documents = []
     successful_docs = 0
     failed_docs = 0
     
-    for entry in corpus:
-        try:
-            logger.info(f"\nProcessing document: {entry['id']}")
-            logger.info(f"   Source: {entry.get('source', 'Unknown')}")
-            logger.info(f"   Path: {entry['path']}")
-            
-            doc_path = Path(entry['path'])
-            if not doc_path.exists():
-                logger.error(f"   Document missing: {doc_path}")
-                raise FileNotFoundError(f"Missing document: {doc_path}")
-            
-            docs = process_single_document(entry)
-            all_documents.extend(docs)
-            successful_docs += 1
-            logger.info(f"   Successfully processed {entry['id']}: {len(docs)} chunks")
-        except Exception as e:
+    # Documents are independent - process them in parallel worker processes
+    pending = []
+    for position, entry in enumerate(corpus):
+        logger.info(f"\nProcessing document: {entry['id']}")
+        logger.info(f"   Source: {entry.get('source', 'Unknown')}")
+        logger.info(f"   Path: {entry['path']}")
+        
+        doc_path = Path(entry['path'])
+        if not doc_path.exists():
             failed_docs += 1
-            logger.error(f"   Failed to process {entry['id']}: {str(e)}")
+            logger.error(f"   Document missing: {doc_path}")
+            logger.error(f"   Failed to process {entry['id']}: Missing document: {doc_path}")
             logger.error(f"   Check document permissions and PDF integrity")
             continue
+        
+        pending.append((position, entry))
+    
+    # Cores left over after one worker per document go to page-level pools
+    cpu_count = os.cpu_count() or 1
+    doc_workers = max(1, min(cpu_count, len(pending)))
+    page_workers = max(1, cpu_count // doc_workers)
+    
+    results = {}
+    with queued_logging() as log_queue, ProcessPoolExecutor(
+        max_workers=doc_workers,
+        initializer=_init_worker_logging,
+        initargs=(log_queue,)
+    ) as executor:
+        futures = {
+            executor.submit(process_single_document, entry, page_workers): (position, entry)
+            for position, entry in pending
+        }
+        
+        for future in as_completed(futures):
+            position, entry = futures[future]
+            try:
+                docs = future.result()
+                # Unpickled worker results carry their own copies of every label
+                intern_metadata(docs)
+                results[position] = docs
+                successful_docs += 1
+                logger.info(f"   Successfully processed {entry['id']}: {len(docs)} chunks")
+            except Exception as e:
+                failed_docs += 1
+                logger.error(f"   Failed to process {entry['id']}: {str(e)}")
+                logger.error(f"   Check document permissions and PDF integrity")
+    
+    # Keep manifest order so chunk ordering is stable across runs
+    for position in sorted(results):
+        all_documents.extend(results[position])
     
     logger.info(f"\nPRE-VALIDATION SUMMARY:")
     logger.info(f"   Successfully processed: {successful_docs}")
@@ -383,13 +696,20 @@ def load_and_preprocess_documents(manifest_path: str = "manifests/corpus_manifes
         
         # Remove bad chunks
         indices_to_remove = {chunk[0] for chunk in problematic}
-        cleaned_documents = [
-            doc for i, doc in enumerate(all_documents) 
-            if i not in indices_to_remove
-        ]
+        original_count = len(all_documents)
+        if len(indices_to_remove) * 2 > original_count:
+            cleaned_documents = [
+                doc for i, doc in enumerate(all_documents) 
+                if i not in indices_to_remove
+            ]
+        else:
+            # Few removals - delete in place from the end instead of copying the list
+            for i in sorted(indices_to_remove, reverse=True):
+                del all_documents[i]
+            cleaned_documents = all_documents
         
         logger.warning(f"AUTOMATICALLY REMOVED {len(problematic)} LOW-QUALITY CHUNKS")
-        logger.warning(f"CLEANED DOCUMENT COUNT: {len(cleaned_documents)} chunks ({len(all_documents)-len(cleaned_documents)} removed)")
+        logger.warning(f"CLEANED DOCUMENT COUNT: {len(cleaned_documents)} chunks ({original_count-len(cleaned_documents)} removed)")
         
         # Safety net - never return empty set
         if not cleaned_documents:
@@ -397,9 +717,14 @@ def load_and_preprocess_documents(manifest_path: str = "manifests/corpus_manifes
             logger.error("MANUAL INTERVENTION REQUIRED: Check document filtering logic")
             raise ValueError("No valid chunks remained after validation - safety compromised")
         
+        # Only cache complete runs so failed documents are retried next time
+        if cache_file is not None and failed_docs == 0:
+            save_cached_documents(cache_file, cleaned_documents)
         return cleaned_documents
     else:
         logger.info("ALL CHUNKS CONTAIN NUTRITION-RELEVANT CONTENT - VALIDATION PASSED")
+        if cache_file is not None and failed_docs == 0:
+            save_cached_documents(cache_file, all_documents)
         return all_documents
 
 # Test execution when run directly
@@ -1,7 +1,28 @@
 import streamlit as st 
-import requests 
+import gzip
+import re
 import time
-from datetime import datetime
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+# requests and datetime are imported where they are used, keeping them off the first page paint
+if TYPE_CHECKING:
+    import requests
+
+# orjson encodes/decodes in C; fall back to the stdlib json module when it isn't installed
+try:
+    import orjson
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    json_loads = json.loads
+
+# Backend timeouts: fail fast when the API is down, but give answers time to generate
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 30
 
 # Streamlit app configuration
 st.set_page_config(
@@ -11,8 +32,91 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Shared HTTP session - keeps the connection to the FastAPI backend alive across chat turns
+@st.cache_resource
+def get_http() -> "requests.Session":
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+# Gzip request bodies of at least GZIP_MIN_BYTES (requests already asks for gzip responses).
+# Off by default: only enable once the backend decodes Content-Encoding: gzip itself -
+# FastAPI's GZipMiddleware only compresses responses, and the stock backend would answer 422
+GZIP_REQUESTS = False
+GZIP_MIN_BYTES = 1024
+
+def encode_body(payload: dict):
+    """JSON-encode a request body, gzipping it when enabled and large enough to be worth it"""
+    body = json_dumps(payload)
+    if not GZIP_REQUESTS or len(body) < GZIP_MIN_BYTES:
+        return body, {}
+    return gzip.compress(body), {"Content-Encoding": "gzip"}
+
+# Streaming backends answer with NDJSON: {"delta": ...} lines, then one line with sources/safety_level
+STREAM_CONTENT_TYPE = "application/x-ndjson"
+
+def stream_answer(response: "requests.Response", placeholder) -> dict:
+    """Render answer deltas as they arrive and return the assembled result"""
+    import requests
+    from urllib3.exceptions import ReadTimeoutError
+
+    result = {"sources": [], "safety_level": "general"}
+
+    def deltas():
+        try:
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                event = json_loads(line)
+                if "delta" in event:
+                    yield event["delta"]
+                else:
+                    result.update(event)
+        except requests.exceptions.ConnectionError as e:
+            # requests reports a read timeout while streaming the body as a ConnectionError
+            if e.args and isinstance(e.args[0], ReadTimeoutError):
+                raise requests.exceptions.ReadTimeout(*e.args, response=response) from e
+            raise
+
+    result["response"] = placeholder.write_stream(deltas())
+    return result
+
+# Source badges never change once rendered, so every history rerun reuses the same HTML
+@lru_cache(maxsize=1024)
+def _badge(source_id: str, page: int) -> str:
+    return f"<span class='source-badge'>{source_id.replace('_', ' ').title()} (p.{page})</span>"
+
+# Text without any markdown/HTML syntax is sent as plain text and skips the client-side markdown renderer.
+# Matches inline markup, tables, escapes and math, line-start lists/quotes/rules, emoji shortcodes and bare URLs
+_PLAIN_RE = re.compile(
+    r"[*_`\[<#|~$\\]"
+    r"|^[ \t]*(?:[-+>]|\d+[.)])(?:[ \t]|$)"
+    r"|^[ \t]*[-=]{2,}[ \t]*$"
+    r"|:\w+:"
+    r"|https?://|www\.",
+    re.MULTILINE,
+)
+
+def _render(container, text: str, unsafe_allow_html: bool = False):
+    if _PLAIN_RE.search(text) is None:
+        container.text(text)
+    else:
+        container.markdown(text, unsafe_allow_html=unsafe_allow_html)
+
+# Logo is read from disk once per server process; cache_resource hands back the same bytes object
+# instead of unpickling a fresh copy on every rerun like cache_data would
+@st.cache_resource
+def _logo_bytes() -> bytes:
+    return Path("frontend/assets/logo.png").read_bytes()
+
 # Custom CSS and Styling
-st.markdown("""
+APP_CSS = """
 <style>
     /* Main Container */
   st.App{
@@ -77,14 +181,37 @@ st.markdown("""
         border-top: 1px solid #e9ecef;
         margin-top: 30px;
     }
-<style>""", unsafe_allow_html=True)
+</style>"""
+
+# Shown for medical-advice queries, whether the backend blocks them in-band or with HTTP 403
+BLOCKED_HTML = """
+<div class="blocked-query">
+<strong>⚕️ Medical Advice Required</strong><br><br>
+This question requires personnalized medical expertise. I cannot provide a response. Please consult a healthcare professional for accurate information and guidance.
+<br><br>
+<strong>Please Consult:</strong>
+<ul> <li>Registered Dietitians</li> <li>Licensed Nutritionists</li> <li>Medical Doctors specializing in nutrition</li> </ul>
+<br><br>
+I can answer general questions about USDA/WHO nutrition guidelines 
+that don't involve your personal health conditions.
+</div>
+"""
+
+# Static markup skips the markdown parser when st.html is available (Streamlit >= 1.33)
+if hasattr(st, "html"):
+    static_html = st.html
+else:
+    def static_html(body: str):
+        st.markdown(body, unsafe_allow_html=True)
+
+static_html(APP_CSS)
 
 # Header & Safety Disclaimer
 
 col1,col2 = st.columns([1,6]) #col1 for logo col2 for title
 
 with col1:
-    st.image("frontend/assets/logo.png", width=80)
+    st.image(_logo_bytes(), width=80)
 
 with col2:
     st.title("NutriGuide AI")
@@ -98,219 +225,252 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+# st.fragment needs Streamlit >= 1.37; older versions simply rerun the whole script
+fragment = getattr(st, "fragment", lambda func: func)
+
 # Chat history management 
 if "messages" not in st.session_state:
     st.session_state.messages =[] #(list to hold messages)
 
-# Display existing chat messages 
-for message in st.session_state.messages:
-    #creating chat message bubble with role (user and message)
-    with st.chat_message(message["role"]):
-        st.markdown(message["content"])
-
-        #show source of citation if available 
-        if "sources" in message and message["sources"]:
-            #create source badge of top 3 sources
-            source_badges = " ".join([
-                f"<span class='source-badge'>{src['source_id'].replace('_', ' ').title()} (p.{src['page']})</span>" 
-                for src in message["sources"][:3] #show top 3 sources
-            ])
-            st.markdown(f"<div style='margin-top: 10px;'>{source_badges}</div>", unsafe_allow_html=True)
-
-        #Display of special not of disclaimer
-        if message.get("safety_level") == "medical_caution":
-            st.info("ℹ️ This response contains medical information. Always consult a healthcare professional for personalized advice.")
-
-# Chat input and API integration 
-# Create chat input box with placeholder text
-if prompt := st.chat_input("Ask NutriGuide AI about nutrition, diets, or health-related topics..."):
-    # Validate prompt before sending to API 
-    if not prompt or len(prompt.strip())<3:
-        st.warning("Please Enter a valid question with at least 3 characters.")
-    else:
+CHAT_INPUT_PLACEHOLDER = "Ask NutriGuide AI about nutrition, diets, or health-related topics..."
+
+# Chat history and input run as one fragment, so submitting a prompt reruns only the
+# chat instead of the whole page (header, disclaimer, sidebar and footer).
+# Fragments render inside a container, so the input is placed in st.bottom to stay pinned
+# to the bottom of the page; without st.bottom the input is created outside and passed in
+@fragment
+def chat(prompt=None):
+    # Display existing chat messages 
+    for message in st.session_state.messages:
+        #creating chat message bubble with role (user and message)
+        with st.chat_message(message["role"]):
+            _render(st, message["content"])
+
+            #show source of citation if available 
+            if "sources" in message and message["sources"]:
+                #create source badge of top 3 sources
+                source_badges = " ".join(
+                    _badge(src['source_id'], src['page'])
+                    for src in message["sources"][:3] #show top 3 sources
+                )
+                st.markdown(f"<div style='margin-top: 10px;'>{source_badges}</div>", unsafe_allow_html=True)
+
+            #Display of special not of disclaimer
+            if message.get("safety_level") == "medical_caution":
+                st.info("ℹ️ This response contains medical information. Always consult a healthcare professional for personalized advice.")
+
+    # Chat input and API integration 
+    # Create chat input box with placeholder text
+    if hasattr(st, "bottom"):
+        with st.bottom:
+            prompt = st.chat_input(CHAT_INPUT_PLACEHOLDER)
+    if prompt:
+        import requests
+
+        # Validate prompt before sending to API 
         clean_prompt = prompt.strip() #remove leading/trailing whitespace
-    # Add user message to chat history
-    st.session_state.messages.append({"role": "user", "content": prompt})
-
-    #Display user message in chat interface
-    with st.chat_message("user"):
-        st.markdown(prompt)
+        if len(clean_prompt) < 3:
+            st.warning("Please Enter a valid question with at least 3 characters.")
+            return #nothing is sent or added to history (return rather than st.stop, we are inside the fragment)
+        # Add user message to chat history
+        st.session_state.messages.append({"role": "user", "content": prompt})
+
+        #Display user message in chat interface
+        with st.chat_message("user"):
+            st.markdown(prompt)
         
-    #Create assistant message when thinking
-    with st.chat_message("assistant"):
-        message_placeholder = st.empty() #placeholder for streaming assistant response
-        message_placeholder.markdown("thinking... :hourglass_flowing_sand:")
-
-        #Call API with error handling 
-        try:
-            start_time = time.time() #start timer (bug fix: changed start to start_time to avoid conflict with start function)
-            response = requests.post(
-                "http://localhost:8000/query", # Fastapi endpoint 
-                json={"question": prompt},     # send question as json
-                timeout=30                     # 30 seconds timeout     
-            )
-            response_time = time.time() - start_time
-            #Handle successful api response http 200
-            if response.status_code == 200:
-                result = response.json()
-
-                #Handle blocked medical queries
-                if result["safety_level"] == "blocked":
-                    blocked_message = """
-                    <div class="blocked-query">
-                    <strong>⚕️ Medical Advice Required</strong><br><br>
-                    This question requires personnalized medical expertise. I cannot provide a response. Please consult a healthcare professional for accurate information and guidance.
-                    <br><br>
-                    <strong>Please Consult:</strong>
-                    <ul> <li>Registered Dietitians</li> <li>Licensed Nutritionists</li> <li>Medical Doctors specializing in nutrition</li> </ul>
-                    <br><br>
-                    I can answer general questions about USDA/WHO nutrition guidelines 
-                    that don't involve your personal health conditions.
-                    </div>
-                    """
-                    message_placeholder.markdown(blocked_message, unsafe_allow_html=True)
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": "Medical advice query blocked - requires professional consultation.",
-                        "safety_level": "blocked"
-                    })
-
-                    # Handling Normal responses
-                else:
-                        # Format response with metadata footer
-                        response_text = result["response"]
+        #Create assistant message when thinking
+        with st.chat_message("assistant"):
+            message_placeholder = st.empty() #placeholder for streaming assistant response
+            message_placeholder.markdown("thinking... :hourglass_flowing_sand:")
+
+            #Call API with error handling 
+            response = None
+            try:
+                body, headers = encode_body({"question": clean_prompt}) # pre-encoded json (gzipped only when enabled)
+                start_time = time.perf_counter() #start timer (bug fix: changed start to start_time to avoid conflict with start function)
+                response = get_http().post(
+                    "http://localhost:8000/query", # Fastapi endpoint 
+                    data=body,
+                    headers=headers,
+                    timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
+                    stream=True                    # start rendering as soon as the first tokens arrive
+                )
+                if response.status_code != 200:
+                    response.content #error bodies are small - reading them lets the connection go back to the pool
+                #Handle successful api response http 200
+                if response.status_code == 200:
+                    if response.headers.get("Content-Type", "").startswith(STREAM_CONTENT_TYPE):
+                        # Plain streamed text first, full markdown + sources once complete
+                        result = stream_answer(response, message_placeholder)
+                    else:
+                        result = json_loads(response.content)
+                    response_time = time.perf_counter() - start_time
 
-                        # Add metadata footer and source count 
-                        response_text += f"\n\n<sub> Response generated in {response_time:.1f} seconds using {len(result['sources'])} sources. </sub>"
+                    #Handle blocked medical queries
+                    if result["safety_level"] == "blocked":
+                        message_placeholder.markdown(BLOCKED_HTML, unsafe_allow_html=True)
+                        st.session_state.messages.append({
+                            "role": "assistant",
+                            "content": "Medical advice query blocked - requires professional consultation.",
+                            "safety_level": "blocked"
+                        })
 
-                        # display response in chat interface
-                        message_placeholder.markdown(response_text, unsafe_allow_html=True)
-                        # Add chat history with metadata 
+                        # Handling Normal responses
+                    else:
+                            # Metadata footer with response time and source count
+                            footer = f"<sub> Response generated in {response_time:.1f} seconds using {len(result['sources'])} sources. </sub>"
+
+                            # display response in chat interface (plain answers skip markdown, only the footer needs it)
+                            with message_placeholder.container():
+                                _render(st, result["response"], unsafe_allow_html=True)
+                                st.markdown(footer, unsafe_allow_html=True)
+                            # Add chat history with metadata 
+                            st.session_state.messages.append({
+                                "role": "assistant",
+                                "content": result["response"],
+                                "sources": result["sources"],
+                                "safety_level": result["safety_level"]
+                            })
+                    # Handle blocked queries at API layer (HTTP 403)
+                elif response.status_code == 403:
+                        message_placeholder.markdown(BLOCKED_HTML, unsafe_allow_html=True)
                         st.session_state.messages.append({
                             "role": "assistant",
-                            "content": result["response"],
-                            "sources": result["sources"],
-                            "safety_level": result["safety_level"]
+                            "content": "Medical advice query blocked - requires professional consultation.",
+                            "safety_level": "blocked"
                         })
-                # Handle blocked queries at API layer (HTTP 403)
-            elif response.status_code == 403:
-                    blocked_message = """
-                    <div class="blocked-query">
-                    <strong>⚕️ Medical Advice Required</strong><br><br>
-                    For safety reasons, I cannot answer questions that require personalized medical advice. Please consult a healthcare professional for accurate information and guidance.
-                    <br><br>
-                    </div>
-                    """
-                    placeholder.markdown(blocked_message, unsafe_allow_html=True)
+
+                # Handle validation errors (HTTP 422) from pydantic 
+                elif response.status_code == 422:
+                    try:
+                        error_detail = json_loads(response.content).get("detail")
+                        if isinstance(error_detail, list) and error_detail:
+                            error_msg = error_detail[0].get("msg", "Question validation failed.")
+                        else:
+                            error_msg = str(error_detail or "Question validation failed.")
+                    except Exception:
+                        error_msg = "Question must be 3-500 characters with valid format. Please revise and try again."
+
+                    error_message = f"⚠️ {error_msg}"
+                    message_placeholder.error(error_message)
                     st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": "Medical advice query blocked - requires professional consultation.",
-                        "safety_level": "blocked"
+                    "role": "assistant", 
+                    "content": error_message
                     })
 
-            # Handle validation errors (HTTP 422) from pydantic 
-            elif response.status_code == 422:
-                try:
-                    error_details = response.json().get("detail", [{"msg": "Invalid question format."}])[0].get("msg", "Invalid question format.")
-                    if isinstance(error_detail, list):
-                        error_message = error_details[0].get("msg", "Question validation failed.")
-                    else:
-                        error_message = str(error_details)
-                except:
-                    error_message = "Question must be 3-500 characters with valid format. Please revise and try again."
-
-                error_message = f"⚠️ {error_msg}"
-                message_placeholder.error(error_message)
-                st.session_state.messages.append({
-                "role": "assistant", 
-                "content": error_message
-                })
 
 
+                # Handle other API errors
+                else: 
+                    error_message = f"❌ Error: Received status code {response.status_code} from API. Please try again later."
+                    message_placeholder.error(error_message)
+                    st.session_state.messages.append({
+                            "role": "assistant",
+                            "content": error_message
+                        })
 
-            # Handle other API errors
-            else: 
-                error_message = f"❌ Error: Received status code {response.status_code} from API. Please try again later."
-                message_placeholder.error(error_message)
-                st.session_state.messages.append({
+            # Handle backend that never accepted the connection
+            except requests.exceptions.ConnectTimeout:
+                    error_message = "❌ Backend unreachable: The nutrition database did not respond. Please make sure the API server is running and try again."
+                    message_placeholder.error(error_message)
+                    st.session_state.messages.append({
                         "role": "assistant",
                         "content": error_message
                     })
 
-        # Handle network errors
-        except requests.exceptions.ConnectionError:
-                    error_message = "❌ Network error: Unable to connect to the nutrition database. Please check your connection and try again."
+            # Handle network errors
+            except requests.exceptions.ConnectionError:
+                        error_message = "❌ Network error: Unable to connect to the nutrition database. Please check your connection and try again."
+                        message_placeholder.error(error_message)
+                        st.session_state.messages.append({
+                            "role": "assistant",
+                            "content": error_message
+                        })
+
+            # Handle timeouts errors
+            except requests.exceptions.Timeout:
+                    error_message = "⚠️ Request timed out. The nutrition database may be busy. Please try again."
                     message_placeholder.error(error_message)
                     st.session_state.messages.append({
                         "role": "assistant",
                         "content": error_message
                     })
 
-        # Handle timeouts errors
-        except requests.exceptions.Timeout:
-                error_message = "⚠️ Request timed out. The nutrition database may be busy. Please try again."
-                message_placeholder.error(error_message)
-                st.session_state.messages.append({
+            # Handle unexpected errors
+            except Exception as e:
+                    error_message = f"⚠️ An unexpected error occurred: {str(e)}"
+                    message_placeholder.error(error_message)
+                    st.session_state.messages.append({
+                            "role": "assistant",
+                            "content": error_message
+                    })
 
-                })
+            # Streamed responses hold their connection until closed
+            finally:
+                if response is not None:
+                    response.close()
+
+if hasattr(st, "bottom"):
+    chat()
+else:
+    chat(st.chat_input(CHAT_INPUT_PLACEHOLDER))
 
-        # Handle unexpected errors
-        except Exception as e:
-                error_message = f"⚠️ An unexpected error occurred: {str(e)}"
-                message_placeholder.error(error_message)
-                st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": error_message
-                })
-                
 # SIDEBAR WITH ADDITIONAL INFO
+# Sidebar copy is static, so it is kept as ready-made HTML rather than re-parsed markdown
+SIDEBAR_ABOUT_HTML = """
+<p><strong>Verified Sources:</strong></p>
+<ul>
+<li>Dietary Guidelines for Americans (USDA/HHS)</li>
+<li>World Health Organization (WHO) guidelines</li>
+<li>Evidence-based recommendations only</li>
+</ul>
+<p><strong>Safety Features:</strong></p>
+<ul>
+<li>✅ Medical advice queries automatically blocked</li>
+<li>✅ Every fact includes source citations</li>
+<li>✅ Mandatory disclaimers on all responses</li>
+<li>✅ Audit trail for compliance</li>
+</ul>
+<p><strong>System Limitations:</strong></p>
+<ul>
+<li>❌ Not a substitute for medical advice</li>
+<li>❌ Cannot diagnose conditions</li>
+<li>❌ Cannot recommend supplements/dosages</li>
+<li>❌ Cannot provide personalized meal plans</li>
+</ul>
+"""
+
+SIDEBAR_GOOD_EXAMPLES_HTML = """
+<p>✅ "What is the daily sodium limit for adults?"</p>
+<p>✅ "How much added sugar should children consume?"</p>
+<p>✅ "What are good sources of potassium?"</p>
+<p>✅ "Vitamin D recommendations during pregnancy?"</p>
+"""
+
+SIDEBAR_BAD_EXAMPLES_HTML = """
+<p>❌ "Should I take vitamin D supplements?"</p>
+<p>❌ "What foods should I avoid with diabetes?"</p>
+<p>❌ "How many mg of zinc should I take daily?"</p>
+<p>❌ "Can you diagnose my nutritional deficiency?"</p>
+"""
+
 #Creating Sidebar with safety information and examples
 with st.sidebar:
     st.header("About NutriGuide AI")
-    st.markdown(""" \n \n
-
-    **Verified Sources:** \n
-    - Dietary Guidelines for Americans (USDA/HHS)
-    - World Health Organization (WHO) guidelines
-    - Evidence-based recommendations only
-    
-    **Safety Features:** \n
-    - ✅ Medical advice queries automatically blocked
-    - ✅ Every fact includes source citations
-    - ✅ Mandatory disclaimers on all responses
-    - ✅ Audit trail for compliance
-    
-    **System Limitations:** \n
-    - ❌ Not a substitute for medical advice
-    - ❌ Cannot diagnose conditions
-    - ❌ Cannot recommend supplements/dosages
-    - ❌ Cannot provide personalized meal plans
-
-    """)
+    static_html(SIDEBAR_ABOUT_HTML)
 
     st.markdown("---")
     st.subheader("Example Questions to Ask NutriGuide AI :  ")
 
     # Provide example questions to guide users
-    st.markdown("""
-
-    ✅ "What is the daily sodium limit for adults?" \n
-    ✅ "How much added sugar should children consume?" \n
-    ✅ "What are good sources of potassium?"    \n
-    ✅ "Vitamin D recommendations during pregnancy?" \n
-
-    """)
+    static_html(SIDEBAR_GOOD_EXAMPLES_HTML)
 
    # Bad examples of questions that would be blocked
     st.subheader("Example Questions NOT to Ask NutriGuide AI :")
-    st.markdown("""
-
-    ❌ "Should I take vitamin D supplements?" \n
-    ❌ "What foods should I avoid with diabetes?" \n
-    ❌ "How many mg of zinc should I take daily?" \n
-    ❌ "Can you diagnose my nutritional deficiency?" \n
-    """)
+    static_html(SIDEBAR_BAD_EXAMPLES_HTML)
     st.markdown("---")
+    from datetime import datetime
     st.caption(f"NutriGuide v1.0 {datetime.now().year} Safety-First Nutrition Chatbot")
 
 
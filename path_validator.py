@@ -1,12 +1,44 @@
+import os
+import sys
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as ManifestLoader
+except ImportError:
+    from yaml import SafeLoader as ManifestLoader
+
 with open('manifests/corpus_manifest.yaml') as f:
-    corpus = yaml.safe_load(f)
-
-for doc in corpus:
-    file_path = Path(doc['path'])
-    if not file_path.exists():
-        print(f"❌ MISSING: {doc['id']} at {file_path}")
-    else:
-        print(f"✅ FOUND: {doc['id']}")
\ No newline at end of file
+    corpus = yaml.load(f, Loader=ManifestLoader)
+
+
+def list_directory(parent):
+    """Names of the files in a directory from a single scandir pass (empty if it can't be listed)"""
+    try:
+        with os.scandir(parent) as entries:
+            # is_file() follows symlinks (dangling links count as missing) and uses the cached d_type otherwise
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
+# One directory read per parent instead of one stat per document, with the
+# reads overlapped across threads since they are I/O-bound
+paths = [Path(doc['path']) for doc in corpus]
+parents = list({p.parent for p in paths})
+with ThreadPoolExecutor(max_workers=max(1, min(32, len(parents)))) as pool:
+    listings = dict(zip(parents, pool.map(list_directory, parents)))
+
+missing = [
+    (doc, file_path) for doc, file_path in zip(corpus, paths)
+    if file_path.name not in listings[file_path.parent]
+]
+
+if not missing:
+    print(f"✅ FOUND: all {len(corpus)} documents present")
+else:
+    sys.stdout.write("".join(
+        f"❌ MISSING: {doc['id']} at {file_path}\n" for doc, file_path in missing
+    ))
+    sys.exit(1)